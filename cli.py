@@ -1,40 +1,64 @@
 import logging
 import os
 import sys
-from argparse import ArgumentParser
-
-from zc.lockfile import LockError, LockFile
 
 from core.config import Config
-from webstore.swgoh.connector import SwgohWebstoreConnector
 
+# Calculate the default config file path relative to the script
+_SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+DEFAULT_CONFIG_PATH = os.path.join(_SCRIPT_DIR, "default_config.ini")
+
+USAGE = """usage: cli.py [-h] [--config CONFIG] email
+
+positional arguments:
+  email                 Email address
+
+options:
+  -h, --help            show this help message and exit
+  --config CONFIG, -c CONFIG
+                        Path to the configuration file"""
 
-def get_parser():
-    parser = ArgumentParser()
 
-    # Calculate the default config file path relative to the script
-    script_directory = os.path.dirname(os.path.realpath(__file__))
-    default_config_path = os.path.join(script_directory, "default_config.ini")
+def parse_argv(argv):
+    # argparse is comparatively slow to import, the two arguments are parsed by hand
+    config = DEFAULT_CONFIG_PATH
+    email = None
 
-    parser.add_argument("email", help="Email address")
-    parser.add_argument("--config", "-c", default=default_config_path, help="Path to the configuration file")
-    return parser
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in ("-h", "--help"):
+            print(USAGE)
+            sys.exit(0)
+        elif arg in ("-c", "--config"):
+            config = next(args, None)
+            if config is None:
+                usage_error(f"argument {arg}: expected one argument")
+        elif arg.startswith("--config="):
+            config = arg.split("=", 1)[1]
+        elif arg.startswith("-") or email is not None:
+            usage_error(f"unrecognized arguments: {arg}")
+        else:
+            email = arg
+    if email is None:
+        usage_error("the following arguments are required: email")
+    return email, config
+
+
+def usage_error(message):
+    print(USAGE.splitlines()[0], file=sys.stderr)
+    print(f"cli.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
 
 
 def main():
-    parser = get_parser()
-    args = parser.parse_args()
-    Config.load_global_config(args.config)
+    email, config_path = parse_argv(sys.argv)
+    # Imported after argument parsing so --help and usage errors stay fast
+    from zc.lockfile import LockError, LockFile
+
+    from webstore.swgoh.connector import SwgohWebstoreConnector
+
+    Config.load_global_config(config_path)
     config = Config.get_global_config()
-    logging.basicConfig(
-        # filename='swgoh_webstore.log',
-        level=config.default_log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('swgoh_webstore.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
     logger = logging.getLogger('__main__')
     # TODO: Add lock options to config
     #  1 -> Use lock
@@ -43,13 +67,24 @@ def main():
     #     * validate lockname
     #     * enfore lock if schedule is allowed
     try:
-        lock = LockFile(f'swgoh_webstore_{args.email}.lock')
+        lock = LockFile(f'swgoh_webstore_{email}.lock')
     except LockError:
         logger.warning('Prevent the script from running multiple times. Exit')
         sys.exit(1)
 
+    # Configured after the lock so a quick exit does not touch the log file
+    logging.basicConfig(
+        # filename='swgoh_webstore.log',
+        level=config.default_log_level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('swgoh_webstore.log', delay=True),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
     connector = SwgohWebstoreConnector(
-        email=args.email,
+        email=email,
         config=config
     )
     connector.start()
@@ -16,8 +16,10 @@ Note:
 """
 
 import configparser
+import functools
 import logging
 import os
+from typing import Optional
 
 
 class SchedulingConflictError(Exception):
@@ -37,9 +39,8 @@ class Config:
     Note:
         - It is important to ensure that configuration options do not conflict, especially when using self-scheduling
           and delay scheduling features.
+        - Option values are read on first access and cached for the lifetime of the instance.
     """
-    _instance = None
-
     def __init__(self, config_file):
         """
         Initialize a Config object.
@@ -47,12 +48,13 @@ class Config:
         Args:
             config_file (str): Path to the configuration file.
         """
-        self.config = configparser.ConfigParser()
+        # No option uses interpolation, the raw parser skips it on every lookup
+        self.config = configparser.RawConfigParser()
         self.file_path = config_file
         self.fallback_base_path = os.path.dirname(os.path.realpath(self.file_path))
         self.config.read(config_file)
 
-    @property
+    @functools.cached_property
     def is_self_scheduling(self):
         """
         Get the 'script_is_self_scheduling' configuration option.
@@ -71,7 +73,7 @@ class Config:
             "General", "script_is_self_scheduling", fallback=False
         )
 
-    @property
+    @functools.cached_property
     def allow_scheduling(self):
         """
         Get the 'allow_scheduling' configuration option.
@@ -89,7 +91,7 @@ class Config:
         """
         return self.config.getboolean("General", "allow_scheduling", fallback=False)
 
-    @property
+    @functools.cached_property
     def max_delay_scheduling_time(self):
         """
         Get the 'max_delay_scheduling_time' configuration option.
@@ -107,13 +109,15 @@ class Config:
         """
         return self.config.getint("General", "max_delay_scheduling_time", fallback=0)
 
-    @property
+    @functools.cached_property
     def login_sleep_time(self) -> float:
         """
         Get the login sleep time.
 
-        This property determines the delay, in seconds, between consecutive checks for
-        the presence of the verification code in the email inbox.
+        This property determines the maximum delay, in seconds, between consecutive checks for
+        the presence of the verification code in the email inbox. The checks start with a
+        quarter of this delay and back off towards it, so the total wait is shorter than
+        `max_verification_attempts * login_sleep_time`.
 
         Returns:
             float: The login sleep time, as specified in the configuration file.
@@ -121,7 +125,7 @@ class Config:
         """
         return self.config.getfloat("General", "login_sleep_time", fallback=0.2)
 
-    @property
+    @functools.cached_property
     def max_login_attempts(self) -> int:
         """
         Get the maximum verification code check attempts.
@@ -135,7 +139,7 @@ class Config:
         """
         return self.config.getint("General", "max_verification_attempts", fallback=10)
 
-    @property
+    @functools.cached_property
     def gmail_credentials_location(self):
         """
         Get the location of Gmail credentials.
@@ -148,7 +152,7 @@ class Config:
         """
         return self.config.get('Paths', 'gmail_credentials_location', fallback=os.path.join(self.fallback_base_path, 'credentials.json'))
 
-    @property
+    @functools.cached_property
     def gmail_token_location(self):
         """
         Get the location to store the Gmail token.
@@ -161,7 +165,7 @@ class Config:
         """
         return self.config.get('Paths', 'gmail_token_location', fallback=self.fallback_base_path)
 
-    @property
+    @functools.cached_property
     def webstore_sessions_location(self):
         """
         Get the location to store the webstore sessions.
@@ -178,19 +182,19 @@ class Config:
         log_level = self.config.get('Logging', key, fallback='')
         return logging._nameToLevel.get(log_level, default_level)
 
-    @property
+    @functools.cached_property
     def default_log_level(self):
         return self.__get_log_level_for_logger('default_level', logging.INFO)
 
-    @property
+    @functools.cached_property
     def gmail_log_level(self):
         return self.__get_log_level_for_logger('gmail_level', self.default_log_level)
 
-    @property
+    @functools.cached_property
     def webstore_log_level(self):
         return self.__get_log_level_for_logger('webstore_level', self.default_log_level)
 
-    def valiate(self):
+    def validate(self):
         if self.is_self_scheduling and self.allow_scheduling:
             raise SchedulingConflictError('Please use only is_self_scheduling or allow_scheduling')
 
@@ -200,14 +204,29 @@ class Config:
             return file_path
         elif not isinstance(file_path, str):
             return None
-        instance = cls(file_path)
-        instance.valiate()
-        return instance
+        path = os.path.realpath(file_path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        return _load(path, mtime)
 
     @classmethod
     def load_global_config(cls, file_path: str):
-        cls._instance = cls.load_config(file_path)
+        global _GLOBAL
+        _GLOBAL = cls.load_config(file_path)
 
     @classmethod
     def get_global_config(cls):
-        return cls._instance
+        return _GLOBAL
+
+
+_GLOBAL: Optional[Config] = None
+
+
+@functools.lru_cache(maxsize=None)
+def _load(path: str, mtime: Optional[int]) -> Config:
+    # The mtime is part of the cache key so an edited file is read again
+    config = Config(path)
+    config.validate()
+    return config
@@ -1,6 +1,8 @@
+import functools
 import re
 import unicodedata
 
+@functools.lru_cache(maxsize=1024)
 def slugify(value, allow_unicode=False):
     """
     Taken from https://github.com/django/django/blob/master/django/utils/text.py
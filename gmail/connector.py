@@ -10,26 +10,36 @@ Example:
 
 """
 
+import functools
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
-from typing import Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
-from google.auth.exceptions import RefreshError
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import Resource, build
-from googleapiclient.errors import HttpError
+from requests import RequestException, Session
 
 from core.config import Config
 from core.utils import slugify
-from gmail.types import GmailMessageListResponse, GmailMessageWrapper
+from gmail.types import GmailHistoryResponse, GmailMessageListResponse, GmailMessageWrapper
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 # TODO: Update and add docstrings
 
 
+@functools.lru_cache(maxsize=32)
+def _load_token(path: str, mtime_ns: int) -> dict:
+    # Keyed by mtime so a rewritten token file is read again
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class GmailConnector:
     SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
+    API_BASE_URL = "https://gmail.googleapis.com/gmail/v1/users/me"
+    MAX_BATCH_WORKERS = 5
     logger = getLogger("GmailConnector")
 
     def __init__(self, email: str, config: Optional[Union[str, Config]] = None):
@@ -42,16 +52,18 @@ class GmailConnector:
         self.token_path: str = os.path.join(
             self.config.gmail_token_location, f"{slugify(email)}_token.json"
         )
-        self.creds: Optional[Credentials] = None
-        self.service: Optional[Resource] = None
+        self.creds: Optional["Credentials"] = None
+        self.session: Session = Session()
 
     def load_credentials(self):
         if self.creds:
             return
+        # The Google client stack is slow to import, only load it when needed
+        from google.oauth2.credentials import Credentials
+
         try:
-            self.creds = Credentials.from_authorized_user_file(
-                self.token_path, self.SCOPES
-            )
+            info = _load_token(self.token_path, os.stat(self.token_path).st_mtime_ns)
+            self.creds = Credentials.from_authorized_user_info(info, self.SCOPES)
             self.logger.debug(
                 "Successfully loaded credentials from file '%s'", self.token_path
             )
@@ -67,6 +79,8 @@ class GmailConnector:
         This method initiates the authorization flow and saves the generated credentials to
         the file specified in the constructor (token_path).
         """
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         flow = InstalledAppFlow.from_client_secrets_file(
             self.config.gmail_credentials_location, self.SCOPES
         )
@@ -94,8 +108,7 @@ class GmailConnector:
 
         Note:
             If the credentials need to be renewed, this method will attempt
-            to refresh them. If an HTTP error occurs during the refresh process,
-            it will fall back to obtaining new credentials.
+            to refresh them. If the refresh fails, it will fall back to obtaining new credentials.
         """
         self.load_credentials()
         if force_renew or not self.creds:
@@ -103,27 +116,78 @@ class GmailConnector:
             return True
         elif self.creds.valid:
             return False
+        from google.auth.exceptions import RefreshError
+        from google.auth.transport.requests import Request
+
         try:
             self.creds.refresh(Request())
-        except (HttpError, RefreshError):
+        except RefreshError:
             self.get_new_credentials()
         return True
 
-    def ensure_service(self):
+    def _get(self, path: str, params: Optional[dict] = None) -> dict:
         """
-        Ensures that the Gmail API service is available and authenticated.
+        Sends an authorized GET request to the Gmail API.
 
-        If valid credentials are already available, it will reuse them to build the service.
-        If credentials need to be renewed or if the service is not yet created, it will initialize
-        a new service using the credentials.
+        Args:
+            path (str): The endpoint path relative to the user's API base URL.
+            params (dict, optional): Query parameters of the request.
 
-        This function should be called before using any methods that require the Gmail API service.
+        Returns:
+            dict: The decoded JSON response.
 
+        Raises:
+            RequestException: If the request fails or returns an error status code.
         """
-        refreshed = self.ensure_credentials()
-        if self.service and not refreshed:
-            return
-        self.service = build("gmail", "v1", credentials=self.creds, cache_discovery=False)
+        self.ensure_credentials()
+        return self._get_with_token(path, self.creds.token, params)
+
+    def _get_with_token(self, path: str, token: str, params: Optional[dict] = None) -> dict:
+        # Does not check the credentials, so worker threads never refresh them or start the authorization flow
+        response = self.session.get(
+            f"{self.API_BASE_URL}/{path}",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=10,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def get_history_id(self) -> Optional[str]:
+        """
+        Retrieves the current history ID of the user's mailbox.
+
+        Returns:
+            str: The history ID, or None if the request failed.
+        """
+        try:
+            return self._get("profile").get("historyId", None)
+        except RequestException as e:
+            self.logger.warning("Could not get the history ID: %s", e)
+            return None
+
+    def get_history(self, start_history_id: str) -> Optional[GmailHistoryResponse]:
+        """
+        Retrieves the messages added to the user's mailbox since the given history ID.
+
+        This only transfers the changes instead of the whole message list, which makes it cheap to poll.
+
+        Args:
+            start_history_id (str): The history ID to list the changes from.
+
+        Returns:
+            GmailHistoryResponse: The added messages and the latest history ID, or None if the request failed.
+        """
+        try:
+            return GmailHistoryResponse(
+                self._get(
+                    "history",
+                    params={"startHistoryId": start_history_id, "historyTypes": "messageAdded"},
+                )
+            )
+        except RequestException as e:
+            self.logger.warning("Could not get the history since %s: %s", start_history_id, e)
+            return None
 
     def get_messages(self):
         """
@@ -132,13 +196,9 @@ class GmailConnector:
         Returns:
             list: A list of email message metadata.
         """
-        self.ensure_service()
         try:
-            # pylint: disable=no-member
-            return GmailMessageListResponse(
-                self.service.users().messages().list(userId="me").execute()
-            )
-        except HttpError:
+            return GmailMessageListResponse(self._get("messages"))
+        except RequestException:
             # TODO add proper error handling
             return []
 
@@ -152,15 +212,35 @@ class GmailConnector:
         Returns:
             dict: Details of the email message.
         """
-        self.ensure_service()
         try:
-            # pylint: disable=no-member
-            return GmailMessageWrapper(
-                self.service.users()
-                .messages()
-                .get(userId="me", id=message_id)
-                .execute()
-            )
-        except HttpError:
+            return GmailMessageWrapper(self._get(f"messages/{message_id}"))
+        except RequestException:
             # TODO add proper error handling
             return None
+
+    def get_message_details_batch(self, message_ids: List[str]) -> List[Optional[GmailMessageWrapper]]:
+        """
+        Retrieves the details of several email messages concurrently.
+
+        Args:
+            message_ids (list): The IDs of the email messages.
+
+        Returns:
+            list: Details of the email messages in the order of the given IDs, None for failed requests.
+        """
+        if len(message_ids) <= 1:
+            return [self.get_message_details(message_id) for message_id in message_ids]
+        # Refresh the credentials once up front, the workers only use the token captured here
+        self.ensure_credentials()
+        token = self.creds.token
+        with ThreadPoolExecutor(max_workers=min(len(message_ids), self.MAX_BATCH_WORKERS)) as executor:
+            return list(
+                executor.map(lambda message_id: self._get_message_details_with_token(message_id, token), message_ids)
+            )
+
+    def _get_message_details_with_token(self, message_id: str, token: str) -> Optional[GmailMessageWrapper]:
+        try:
+            return GmailMessageWrapper(self._get_with_token(f"messages/{message_id}", token))
+        except RequestException as e:
+            self.logger.warning("Could not get the details of message %s: %s", message_id, e)
+            return None
@@ -1,70 +1,98 @@
+import re
+import sys
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import cached_property
 
 # TODO: Update and add docstrings
 
+_RFC2822_DATE = re.compile(
+    r"^[A-Za-z]{3}, (\d{1,2}) ([A-Za-z]{3}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) ([+-])(\d{2})(\d{2})$"
+)
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+# Interned so header lookups can short-circuit on identity
+_SUBJECT = sys.intern("Subject")
+_FROM = sys.intern("From")
+_TO = sys.intern("To")
+_DATE = sys.intern("Date")
+
+
+def _parse_date(value: str) -> datetime:
+    # Fast path for the usual Gmail format, anything else goes through the email package
+    _match = _RFC2822_DATE.match(value)
+    if not _match or _match[2] not in _MONTHS:
+        return parsedate_to_datetime(value)
+    day, month, year, hour, minute, second, sign, tz_hours, tz_minutes = _match.groups()
+    offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+    return datetime(
+        int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second),
+        tzinfo=timezone(-offset if sign == "-" else offset),
+    )
+
+
 class GmailEmailHeaders:
     def __init__(self, headers: List[dict]):
-        self._headers = {header["name"]: header["value"] for header in headers}
+        self._raw = headers
+
+    @cached_property
+    def _headers(self) -> dict:
+        return {sys.intern(header["name"]): header["value"] for header in self._raw}
 
     @property
     def subject(self) -> Optional[str]:
-        return self._headers.get("Subject", None)
+        return self._headers.get(_SUBJECT, None)
 
     @property
     def sender(self) -> Optional[str]:
-        return self._headers.get("From", None)
+        return self._headers.get(_FROM, None)
 
     @property
     def receiver(self) -> Optional[str]:
-        return self._headers.get("To", None)
+        return self._headers.get(_TO, None)
 
     @property
     def date(self) -> Optional[str]:
-        return self._headers.get("Date", None)
+        return self._headers.get(_DATE, None)
 
-    @property
+    @cached_property
     def dt_date(self) -> Optional[datetime]:
         if self.date:
             try:
-                return datetime.strptime(
-                    self.date, "%a, %d %b %Y %H:%M:%S %z"
-                )  # "%Y-%m-%d %H:%M:%S")
-            except ValueError:
+                return _parse_date(self.date)
+            except (TypeError, ValueError):
                 pass
         return None
 
 
-class GmailMessagePayload:
-    def __init__(self, data) -> None:
-        self.data = data
-        self.headers = GmailEmailHeaders(headers=self.data.get("headers", []))
-
-
 class GmailMessageWrapper:
-    def __init__(self, data):
-        self.data = data
-        self.payload = GmailMessagePayload(data.get("payload", {}))
-
-    @property
-    def message_id(self):
-        return self.data.get("id", "")
-
-    @property
-    def thread_id(self):
-        return self.data.get("threadId", "")
+    __slots__ = ("message_id", "thread_id", "subject", "receiver", "_raw", "_headers")
 
-    @property
-    def headers(self):
-        return self.payload.headers
-
-    @property
-    def subject(self):
-        return self.headers.subject
+    def __init__(self, data):
+        self._raw = data
+        self.message_id: str = data.get("id", "")
+        self.thread_id: str = data.get("threadId", "")
+        self.subject: Optional[str] = None
+        self.receiver: Optional[str] = None
+        self._headers: Optional[GmailEmailHeaders] = None
+        # Only the headers used for the code lookup are extracted, in a single pass
+        for header in data.get("payload", {}).get("headers", []):
+            name = sys.intern(header["name"])
+            if name is _SUBJECT:
+                self.subject = header["value"]
+            elif name is _TO:
+                self.receiver = header["value"]
 
     @property
-    def receiver(self):
-        return self.headers.receiver
+    def headers(self) -> GmailEmailHeaders:
+        # Built once on first access so its lazy lookups and parsed date are kept
+        if self._headers is None:
+            self._headers = GmailEmailHeaders(headers=self._raw.get("payload", {}).get("headers", []))
+        return self._headers
 
 
 class GmailMessageListEntry:
@@ -75,8 +103,20 @@ class GmailMessageListEntry:
 
 class GmailMessageListResponse:
     def __init__(self, json_data: dict):
-        self.messages: List[GmailMessageListEntry] = [
-            GmailMessageListEntry(message) for message in json_data.get("messages", [])
-        ]
+        self._raw_messages: List[dict] = json_data.get("messages", [])
         self.nextPageToken: Optional[str] = json_data.get("nextPageToken", None)
         self.resultSizeEstimate: int = json_data.get("resultSizeEstimate", 0)
+
+    @cached_property
+    def messages(self) -> List[GmailMessageListEntry]:
+        return [GmailMessageListEntry(message) for message in self._raw_messages]
+
+
+class GmailHistoryResponse:
+    def __init__(self, json_data: dict):
+        self.historyId: Optional[str] = json_data.get("historyId", None)
+        self.messagesAdded: List[GmailMessageListEntry] = [
+            GmailMessageListEntry(added.get("message", {}))
+            for record in json_data.get("history", [])
+            for added in record.get("messagesAdded", [])
+        ]
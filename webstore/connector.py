@@ -6,24 +6,115 @@ It allows users to request one-time codes, verify codes, retrieve offers,
 and purchase items from the store.
 """
 
+import json
 import logging
 import os
 import pickle
+import random
 import re
 from datetime import datetime, timedelta
-from sched import scheduler
+from sched import Event, scheduler
 from time import sleep, time
-from typing import Optional, Union, Type
-from uuid import uuid4
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple, Union, Type
+from uuid import UUID
 from urllib import parse as urlparse
 
 from requests import ConnectionError as RequestConnectionError
 from requests import Session
 from requests import Timeout as RequestTimeout
+from requests.adapters import HTTPAdapter
+from requests.cookies import create_cookie
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from core.config import Config
 from core.utils import slugify
 from gmail.connector import GmailConnector
+from gmail.types import GmailMessageWrapper
+
+
+def _extract_code(url: str) -> Optional[str]:
+    """
+    Return the first non-empty 'code' query parameter of the given URL, decoded like `urlparse.parse_qs` does.
+    """
+    query = url.partition("#")[0].partition("?")[2]
+    for param in query.split("&"):
+        if param.startswith("code=") and len(param) > 5:
+            return urlparse.unquote_plus(param[5:])
+    return None
+
+
+def _json_loads(data: bytes):
+    # orjson is optional, it decodes the store responses considerably faster when installed
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Shared by the sessions of all connectors, so accounts reuse the pooled connections to the store hosts.
+# Each session still keeps its own cookies.
+_SHARED_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=64,
+    pool_block=False,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        # Purchases and the login submits are not known to be idempotent, so POSTs are only retried on
+        # connect errors, when the request never reached the server
+        allowed_methods=frozenset(["GET"]),
+    ),
+)
+
+
+def _create_ping_session() -> Session:
+    # Kept apart from the store sessions so the probe neither takes a pooled store connection nor
+    # sends the store cookies and headers to Google
+    session = Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    return session
+
+
+# First byte of a pickle (protocol 2 and later), used to detect session files of older versions
+_PICKLE_MAGIC = b"\x80"
+
+# Marks the lazily created Gmail connector as not created yet, None means creating it failed
+_UNSET = object()
+
+# Purchase request body, only the currency type, item id and request id change between purchases.
+# The first two are filled in as JSON encoded strings.
+_PURCHASE_TEMPLATE = (
+    b'{"countryCode":"DE","currencyCode":"EUR","currencyType":%b,"purchasePrice":0,'
+    b'"itemId":%b,"quantity":1,"requestId":"%b"}'
+)
+
+
+class UnhandledStatusCodeError(NotImplementedError):
+    """Custom exception to indicate a web store response with a status code that isn't handled."""
+
+    def __init__(self, response, include_body: bool = False):
+        super().__init__(response.status_code)
+        self.response = response
+        self.status_code: int = response.status_code
+        self.include_body = include_body
+
+    def __str__(self):
+        # Formatted on demand, the response body is only decoded if the error is actually printed
+        if self.include_body:
+            return f'Unhandled Status Code "{self.status_code}": {self.response.text}'
+        return f'Unhandled Status Code "{self.status_code}"'
+
 
 # TODO: Move scheduler logic to own class
 # TODO: Update and add docstrings
@@ -43,63 +134,171 @@ class EAWebstoreConnector:
     BASE_URL = None
     EA_ACCOUNTS_AUTH_URL = "https://accounts.ea.com/connect/auth?mode=junoNff&client_id=SWGOH_SERVER_WEB_APP&response_type=code&hide_create=true&redirect_uri=https://store.galaxy-of-heroes.starwars.ea.com"
     
+    EA_SUBJECT_PREFIX = "Verification Code For EA"
+    # Set to True to match subjects with the regex instead of the prefix scan
+    USE_SUBJECT_PATTERN = False
     EA_SUBJECT_PATTERN = re.compile("^Verification Code For EA[^0-9]*([0-9]+)$")
+    EA_ACCESS_CODE_URL = "https://store.galaxy-of-heroes.starwars.ea.com/auth/access_code"
     SESSION_FILENAME_PREFIX = ''
     session_class: Type['Session'] = Session
     logger = logging.getLogger("EAWebstoreConnector")
+    _ping_session: ClassVar[Session] = _create_ping_session()
+
+    __slots__ = (
+        "config",
+        "email",
+        "session_filename",
+        "session",
+        "scheduler",
+        "_scheduled_purchases",
+        "_auth_id",
+        "_headers",
+        "_session_state_hash",
+        "_gmail_connector",
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # BASE_URL is fixed per store, build the request URLs once per subclass
+        cls._offers_url = f"{cls.BASE_URL}/store/offers?countryCode="
+        cls._purchase_url = f"{cls.BASE_URL}/store/purchase"
 
     def __init__(self, email: str, config: Optional[Union[str, Config]] = None):
         self.config: Config = Config.load_config(config) or Config.get_global_config()
         self.email: str = email
-        try:
-            self.gmail_connector: GmailConnector = GmailConnector(
-                email=email, config=self.config
-            )
-        except ValueError as e:
-            self.logger.error(e)
-            self.gmail_connector = None
-        self.session_filename: str = os.path.join(
+        self._gmail_connector = _UNSET
+        session_filename_base = os.path.join(
             self.config.webstore_sessions_location,
-            f"{self.SESSION_FILENAME_PREFIX}{slugify(email)}_session.pickle",
+            f"{self.SESSION_FILENAME_PREFIX}{slugify(email)}_session",
         )
+        self.session_filename: str = f"{session_filename_base}.json"
         self.session = self.session_class()
+        self._configure_session()
         self.scheduler = scheduler(time, sleep)
+        # Pending purchase events by item id, avoids scanning the scheduler queue
+        self._scheduled_purchases: Dict[str, Event] = {}
         self.logger.setLevel(self.config.webstore_log_level)
         self.auth_id = None
+        self._session_state_hash: Optional[int] = None
 
         # Attempt to load the session from a file
         if os.path.exists(self.session_filename):
             self.load_session()
+        elif os.path.exists(f"{session_filename_base}.pickle"):
+            # Session file of an older version, the next save writes it to the JSON file
+            self.load_session(f"{session_filename_base}.pickle")
 
         self.schedule_ping()
         self.schedule_connection_check()
 
+    @property
+    def gmail_connector(self) -> Optional[GmailConnector]:
+        """
+        The Gmail connector used to read verification codes, created on first use.
+
+        A still valid session never needs it, so accounts that don't have to log in skip its setup.
+        """
+        if self._gmail_connector is _UNSET:
+            try:
+                self._gmail_connector = GmailConnector(email=self.email, config=self.config)
+            except ValueError as e:
+                self.logger.error(e)
+                self._gmail_connector = None
+        return self._gmail_connector
+
+    def _configure_session(self):
+        """
+        Mount the shared pooled, retrying adapter and set the headers shared by all requests.
+
+        The store is polled repeatedly, so keeping its connections alive avoids a TLS handshake per request.
+        """
+        self.session.mount("https://", _SHARED_ADAPTER)
+        self.session.mount("http://", _SHARED_ADAPTER)
+        self.session.headers.update({"Accept-Language": "DE", "Connection": "keep-alive"})
+
+    @property
+    def auth_id(self):
+        return self._auth_id
+
+    @auth_id.setter
+    def auth_id(self, value):
+        # The request headers only depend on the auth id, rebuild them once it changes
+        self._auth_id = value
+        self._headers = {'X-Rpc-Auth-Id': value} if value else {}
+
     def get_default_headers(self):
-        if self.auth_id:
-            return {
-                'X-Rpc-Auth-Id': self.auth_id,
-                "Accept-Language": "DE"
-            }
+        return self._headers
+
+    def _session_state(self) -> dict:
+        """
+        Return the part of the session needed to reuse a login: its cookies and headers.
+        """
         return {
-            "Accept-Language": "DE"
+            "cookies": [
+                {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "domain": cookie.domain,
+                    "path": cookie.path,
+                    "port": cookie.port,
+                    "secure": cookie.secure,
+                    "expires": cookie.expires,
+                    "discard": cookie.discard,
+                    # http.cookiejar only exposes the names of the non-standard attributes through _rest
+                    "rest": {name: cookie.get_nonstandard_attr(name) for name in cookie._rest},
+                }
+                for cookie in self.session.cookies
+            ],
+            "headers": dict(self.session.headers),
         }
 
-    def load_session(self):
+    def load_session(self, filename: Optional[str] = None):
         """
         Load and deserialize a session object from a file.
+
+        Session files written by older versions contain a pickled session. They are still loaded and are
+        replaced by the JSON format on the next save.
+
+        Args:
+            filename (str, optional): The file to load the session from. Defaults to the session filename.
         """
-        with open(self.session_filename, "rb") as file:
-            self.session = pickle.load(file)
+        filename = filename or self.session_filename
+        with open(filename, "rb") as file:
+            data = file.read()
+        if data[:1] == _PICKLE_MAGIC:
+            self.session = pickle.loads(data)
+        else:
+            state = _json_loads(data)
+            self.session = self.session_class()
+            for cookie in state["cookies"]:
+                self.session.cookies.set_cookie(create_cookie(**cookie))
+            self.session.headers.update(state["headers"])
+        self._session_state_hash = hash(data)
+        self._configure_session()
         self.logger.debug(
-            "Successfully loaded session from file '%s'", self.session_filename
+            "Successfully loaded session from file '%s'", filename
         )
 
     def save_session(self):
         """
-        Serialize and save the session object to a file.
+        Serialize and save the session cookies and headers to a file.
+
+        The file is only rewritten if the serialized session changed since it was last loaded or saved, and is
+        replaced atomically so an interrupted write can't corrupt it.
         """
-        with open(self.session_filename, "wb") as file:
-            pickle.dump(self.session, file)
+        data = _json_dumps(self._session_state())
+        data_hash = hash(data)
+        if data_hash == self._session_state_hash:
+            self.logger.debug("Session unchanged, skip saving to file '%s'", self.session_filename)
+            return
+        tmp_filename = f"{self.session_filename}.tmp"
+        with open(tmp_filename, "wb") as file:
+            file.write(data)
+            # Make sure the data is on disk before the rename, otherwise a power loss can leave an empty file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_filename, self.session_filename)
+        self._session_state_hash = data_hash
         self.logger.debug(
             "Successfully saved session to file '%s'", self.session_filename
         )
@@ -115,13 +314,13 @@ class EAWebstoreConnector:
             StoreData or None: If successful, returns StoreData; otherwise, returns None.
 
         Raises:
-            NotImplementedError: If the request returns an unhandled status code.
+            UnhandledStatusCodeError: If the request returns an unhandled status code.
 
         This method sends a request to retrieve available offers from the web store.
         """
         self.logger.info("Get offers for account %s", self.email)
         response = self.session.get(
-            url=f"{self.BASE_URL}/store/offers?countryCode=",
+            url=self._offers_url,
             headers=self.get_default_headers(),
         )
         self.logger.debug(
@@ -130,10 +329,15 @@ class EAWebstoreConnector:
             response.status_code,
         )
         if response.status_code == 200:
-            return self._wrap_offers(response.json())
+            return self._wrap_offers(_json_loads(response.content))
         elif response.status_code == 401:
             return None
-        raise NotImplementedError(f'Unhandled Status Code "{response.status_code}": {response.text}')
+        raise UnhandledStatusCodeError(response, include_body=True)
+
+    @staticmethod
+    def _next_request_id() -> str:
+        # The request id only has to be unique for this client, no need for a urandom syscall per purchase
+        return str(UUID(int=random.getrandbits(128), version=4))
 
     def purchase_offer(self, item_id: str, currency_type: str):
         """
@@ -147,55 +351,72 @@ class EAWebstoreConnector:
             dict or None: If successful, returns the purchase response as a dictionary; otherwise, returns None.
 
         Raises:
-            NotImplementedError: If the request returns an unhandled status code.
+            UnhandledStatusCodeError: If the request returns an unhandled status code.
 
         This method sends a request to purchase an offer from the web store.
         """
         self.logger.info("Purchase item '%s' for account '%s'", item_id, self.email)
         response = self.session.post(
-            url=f"{self.BASE_URL}/store/purchase",
-            headers=self.get_default_headers(),
-            json={
-                "countryCode": "DE",
-                "currencyCode": "EUR",
-                "currencyType": currency_type,
-                "purchasePrice": 0,
-                "itemId": item_id,
-                "quantity": 1,
-                "requestId": str(uuid4()),
-            },
-        )
-        self.logger.debug(
-            "[purchase_offer - %s] Request Body: %s",
-            self.email,
-            str(response.request.body),
-        )
-        self.logger.debug(
-            "[purchase_offer - %s] Response Status Code: %i",
-            self.email,
-            response.status_code,
-        )
-        self.logger.debug(
-            "[purchase_offer - %s] Response Body: %s", self.email, response.text
+            url=self._purchase_url,
+            headers={**self.get_default_headers(), "Content-Type": "application/json"},
+            data=_PURCHASE_TEMPLATE % (
+                _json_dumps(currency_type),
+                _json_dumps(item_id),
+                self._next_request_id().encode("ascii"),
+            ),
         )
+        # The body bytes are shared by the debug log and the JSON decoding. response.text is avoided since it
+        # may run charset detection on every access.
+        payload = response.content
+        # Decoding the bodies is not free, only touch them if they are actually logged
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "[purchase_offer - %s] Request Body: %s",
+                self.email,
+                response.request.body.decode("utf-8", "replace"),
+            )
+            self.logger.debug(
+                "[purchase_offer - %s] Response Status Code: %i",
+                self.email,
+                response.status_code,
+            )
+            self.logger.debug(
+                "[purchase_offer - %s] Response Body: %s", self.email, payload.decode("utf-8", "replace")
+            )
         if response.status_code == 200:
-            return response.json()
+            return _json_loads(payload)
         elif response.status_code == 401:
             return None
-        raise NotImplementedError(f'Unhandled Status Code "{response.status_code}"')
+        raise UnhandledStatusCodeError(response)
 
     def get_code_from_message(self, message_id):
         if not self.gmail_connector:
             return None
-        message = self.gmail_connector.get_message_details(message_id)
-        if not message.receiver or not message.subject:
+        return self._get_code_from_message_details(
+            self.gmail_connector.get_message_details(message_id)
+        )
+
+    def _get_code_from_message_details(self, message: Optional[GmailMessageWrapper]) -> Optional[str]:
+        if not message or not message.receiver or not message.subject:
             return None
         elif self.email not in message.receiver:
             return None
-        _match = self.EA_SUBJECT_PATTERN.match(message.subject)
-        if not _match:
+        return self._get_code_from_subject(message.subject)
+
+    def _get_code_from_subject(self, subject: str) -> Optional[str]:
+        # Most inbox messages are unrelated, reject them before running the regex or the scan
+        if not subject.startswith(self.EA_SUBJECT_PREFIX):
             return None
-        return _match[1]
+        if self.USE_SUBJECT_PATTERN:
+            _match = self.EA_SUBJECT_PATTERN.match(subject)
+            return _match[1] if _match else None
+        # Same as EA_SUBJECT_PATTERN: the prefix, any non-digits, then only digits until the end
+        tail = subject[len(self.EA_SUBJECT_PREFIX):]
+        for i, char in enumerate(tail):
+            if "0" <= char <= "9":
+                code = tail[i:]
+                return code if code.isascii() and code.isdigit() else None
+        return None
 
     def login(self, force_login: bool = False) -> None:
         """
@@ -219,10 +440,9 @@ class EAWebstoreConnector:
             raise Exception("Failed to get accounts URL")
         
         # Check if it's already the code, we can skip the login process
-        _parsed = urlparse.urlparse(response.url)
-        if "code" in urlparse.parse_qs(_parsed.query):
+        code = _extract_code(response.url)
+        if code:
             self.logger.debug("Code found in URL, skipping login process...")
-            code = urlparse.parse_qs(_parsed.query)["code"][0]
         else:
             self.logger.debug("Perform login process...")
             code = self._perform_login(response.url)
@@ -248,7 +468,7 @@ class EAWebstoreConnector:
             # TODO: improve error handling
             raise Exception("Failed to get signin page")
         self.logger.debug("Submit email...")
-        pre_message_list = self._get_messages()
+        history_id = self._get_history_id()
         response = self.session.post(url, data={
             "email": self.email,
             "_eventId": "submit",
@@ -259,7 +479,7 @@ class EAWebstoreConnector:
         if response.status_code != 200:
             # TODO: improve error handling
             raise Exception("Failed to submit email")
-        code = self._get_code_from_gmail_account(pre_message_list)
+        code = self._get_code_from_gmail_account(history_id)
         if not code:
             print("Failed to get code from Gmail account.")
             code = input("Enter the code: ")
@@ -271,12 +491,12 @@ class EAWebstoreConnector:
             # TODO: improve error handling
             raise Exception("Failed to submit code")
 
-        _parsed = urlparse.urlparse(response.url)
-        if "code" not in urlparse.parse_qs(_parsed.query):
+        code = _extract_code(response.url)
+        if not code:
             # TODO: improve error handling
             raise Exception("Failed to get code in redirect location")
         
-        return urlparse.parse_qs(_parsed.query)["code"][0]
+        return code
 
     def _finish_login(self, code):
         """
@@ -292,42 +512,49 @@ class EAWebstoreConnector:
             KeyError: If the authentication ID cannot be retrieved from the server response.
 
         """
-        finish = self.session.post("https://store.galaxy-of-heroes.starwars.ea.com/auth/access_code", json={
+        finish = self.session.post(self.EA_ACCESS_CODE_URL, json={
             "access_code": code,
             "redirect_uri": "https://store.galaxy-of-heroes.starwars.ea.com"
         })
-        self.auth_id = finish.json()["authId"]
+        self.auth_id = _json_loads(finish.content)["authId"]
 
-    def _get_messages(self):
+    def _get_history_id(self) -> Optional[str]:
         if not self.gmail_connector:
             return None
-        self.logger.debug("Get messages...")
-        return self.gmail_connector.get_messages()
+        self.logger.debug("Get history id...")
+        return self.gmail_connector.get_history_id()
 
-    def _get_code_from_gmail_account(self, pre_messages_list: Optional[list]):
-        if not self.gmail_connector or pre_messages_list is None:
+    def _get_code_from_gmail_account(self, history_id: Optional[str]):
+        if not self.gmail_connector or history_id is None:
             return None
         code = None
-        self.logger.debug("Get messages...")
+        self.logger.debug("Get new messages...")
+        # Start polling quickly and back off towards the configured sleep time
+        max_delay = self.config.login_sleep_time
+        delay = max_delay / 4
         for _ in range(0, self.config.max_login_attempts):
-            sleep(self.config.login_sleep_time)
-            new_messages_list = self._get_messages()
-            if not new_messages_list:
-                self.logger.debug("No messages found, retrying...")
+            sleep(delay)
+            delay = min(delay * 1.5, max_delay)
+            # Only the messages added since the last poll are listed, not the whole inbox
+            history = self.gmail_connector.get_history(history_id)
+            if history is None:
+                self.logger.debug("Failed to get new messages, retrying...")
                 continue
-            # TODO: In case the prev. Code wasn't used the same code is send which results in the check evaluating to False. This should be fixed.
-            has_new_messages = (
-                new_messages_list.messages[0].id != pre_messages_list.messages[0].id
-            )
-            if not has_new_messages:
+            history_id = history.historyId or history_id
+            if not history.messagesAdded:
+                self.logger.debug("No new messages found, retrying...")
                 continue
-            for entry in new_messages_list.messages:
-                if entry.id == pre_messages_list.messages[0].id:
-                    break
-                code = self.get_code_from_message(entry.id)
+            # The history lists the oldest change first, check the newest message first
+            new_message_ids = [entry.id for entry in reversed(history.messagesAdded)]
+            # The newest message usually is the code mail, only fetch the others if it isn't
+            code = self.get_code_from_message(new_message_ids[0])
+            if code:
+                break
+            # Fetch the remaining messages at once instead of one round-trip after the other
+            for message in self.gmail_connector.get_message_details_batch(new_message_ids[1:]):
+                code = self._get_code_from_message_details(message)
                 if code:
                     break
-            pre_messages_list = new_messages_list
             if code:
                 break
         return code
@@ -335,9 +562,10 @@ class EAWebstoreConnector:
     def schedule_connection_check(self):
         if not self.config.is_self_scheduling:
             return
-        url = "https://google.com"
+        # Returns an empty 204 response, there is no body to download
+        url = "https://www.google.com/generate_204"
         try:
-            self.session.get(url, timeout=5)
+            self._ping_session.head(url, timeout=5, allow_redirects=False).close()
             self.logger.info("Successfully pinged '%s'", url)
         except (RequestConnectionError, RequestTimeout):
             self.logger.warning(
@@ -381,19 +609,16 @@ class EAWebstoreConnector:
                 str(timedelta(seconds=delay)),
             )
             return
-        for queue_entry in self.scheduler.queue:
-            if queue_entry.action != self.purchase_offer:
-                continue
-            elif item_id in queue_entry.kwargs:
-                self.logger.warning(
-                    "Item already scheduled, skipping scheduling of item %s", item_id
-                )
-                return
+        if item_id in self._scheduled_purchases:
+            self.logger.warning(
+                "Item already scheduled, skipping scheduling of item %s", item_id
+            )
+            return
 
-        self.scheduler.enter(
+        self._scheduled_purchases[item_id] = self.scheduler.enter(
             delay=delay,
             priority=1,
-            action=self.purchase_offer,
+            action=self._run_scheduled_purchase,
             kwargs={"item_id": item_id, "currency_type": currency_type},
         )
         self.logger.info(
@@ -402,6 +627,10 @@ class EAWebstoreConnector:
             str(timedelta(seconds=delay)),
         )
 
+    def _run_scheduled_purchase(self, item_id: str, currency_type: str):
+        self._scheduled_purchases.pop(item_id, None)
+        return self.purchase_offer(item_id=item_id, currency_type=currency_type)
+
     def get_delta(self):
         _now = datetime.now()
         return timedelta(seconds=self.scheduler.queue[0].time - _now.timestamp())
@@ -412,14 +641,11 @@ class EAWebstoreConnector:
         elif run_directly:
             return self.run()
 
-        purchase_queue = None
-        for queue_entry in self.scheduler.queue:
-            if queue_entry.action == self.purchase_offer:
-                purchase_queue = queue_entry
-                break
-
-        if purchase_queue:
-            self.scheduler.enterabs(purchase_queue.time + 5, 1, self.run)
+        purchase_event = min(
+            self._scheduled_purchases.values(), key=lambda event: event.time, default=None
+        )
+        if purchase_event:
+            self.scheduler.enterabs(purchase_event.time + 5, 1, self.run)
             self.logger.info(
                 "Successfully scheduled run after the next purchase (in %s)",
                 str(self.get_delta()),
@@ -439,19 +665,17 @@ class EAWebstoreConnector:
         if not offers:
             self.login()
             offers = self.get_offers()
-        free_offers = []
-        for ws_offer in offers.web_store_offers:
-            offer = ws_offer.offer
-            if not offer.is_free_offer:
-                continue
-            self.logger.info("FreeOffer found: %s", ws_offer.item.title)
-            if offer.price.purchase_amount > 0:
-                self.logger.warning(
-                    "Free Offer without Free price found! Please investigate..."
-                )
-                continue
-            free_offers.append(ws_offer)
-        return free_offers
+        return [item for item, _, delay in self._iter_free_offers(offers) if delay <= 0]
+
+    def _iter_free_offers(self, offers) -> Iterator[Tuple[Any, Any, int]]:
+        """
+        Yield the free offers of the store which can be purchased now or later.
+
+        Yields:
+            tuple: The store item, its free offer and the delay in seconds until it can be purchased
+            (0 or less if it can be purchased now).
+        """
+        raise NotImplementedError
 
     def _handle_offers(self, offers) -> bool:
         raise NotImplementedError
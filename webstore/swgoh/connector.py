@@ -1,7 +1,10 @@
 import logging
 from datetime import datetime, timezone
+from math import ceil
+from time import time
+from typing import Iterator, Tuple
 from webstore.connector import EAWebstoreConnector
-from webstore.swgoh.store_types import StoreData
+from webstore.swgoh.store_types import Offer, StoreData, StoreItem
 
 class SwgohWebstoreConnector(EAWebstoreConnector):
     """
@@ -19,32 +22,43 @@ class SwgohWebstoreConnector(EAWebstoreConnector):
     SESSION_FILENAME_PREFIX = 'swgoh_'
     logger = logging.getLogger("SwgohWebstoreConnector")
 
+    __slots__ = ()
+
     def _wrap_offers(self, data):
         return StoreData(data=data)
 
-    def _handle_offers(self, offers: StoreData):
-        now = datetime.now(tz=timezone.utc)
-        purchases = 0
+    def _iter_free_offers(self, offers: StoreData) -> Iterator[Tuple[StoreItem, Offer, int]]:
+        # Compare the epoch timestamps directly, datetimes are only built for the log messages
+        now = time()
         for item in offers.items:
-            free_offers = [o for o in item.offers if o.currencyType == 'FREE']
-            if not free_offers:
+            free_offer = next((o for o in item.offers if o.currencyType == 'FREE'), None)
+            if free_offer is None:
                 continue
-            free_offer = free_offers.pop(0)
-            start_time = datetime.fromtimestamp(item.startTime, tz=timezone.utc)
-            end_time = datetime.fromtimestamp(item.endTime, tz=timezone.utc)
-            available_at = None
-            if free_offer.availableAtEpoch is not None:
-                available_at = datetime.fromtimestamp(free_offer.availableAtEpoch, tz=timezone.utc)
-            if now < start_time:
-                self.logger.info("%s will be available at %s", item.name, str(start_time))
+            if now < item.startTime:
+                self.logger.info(
+                    "%s will be available at %s",
+                    item.name,
+                    str(datetime.fromtimestamp(item.startTime, tz=timezone.utc)),
+                )
                 continue
-            if end_time < now:
-                self.logger.info("%s alread expired at %s", item.name, str(end_time))
+            if item.endTime < now:
+                self.logger.info(
+                    "%s alread expired at %s",
+                    item.name,
+                    str(datetime.fromtimestamp(item.endTime, tz=timezone.utc)),
+                )
                 continue
-            if not available_at or now < available_at:
-                delay = datetime.fromtimestamp(free_offer.availableAtEpoch, tz=timezone.utc) - now
+            if free_offer.availableAtEpoch is None:
+                self.logger.info("%s has no availability time, skipping", item.name)
+                continue
+            yield item, free_offer, ceil(free_offer.availableAtEpoch - now)
+
+    def _handle_offers(self, offers: StoreData):
+        purchases = 0
+        for item, free_offer, delay in self._iter_free_offers(offers):
+            if delay > 0:
                 self.schedule_purchase(
-                    delay=delay.seconds,
+                    delay=delay,
                     item_id=item.id,
                     currency_type=free_offer.currencyType
                 )
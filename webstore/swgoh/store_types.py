@@ -1,6 +1,32 @@
 from typing import List, Optional
 
 class StoreItem:
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "image",
+        "order",
+        "storeTab",
+        "offers",
+        "bucketItems",
+        "startTime",
+        "endTime",
+        "promoText1",
+        "guarantee",
+        "detailedDescription",
+        "quantityImage",
+        "quantity",
+        "bonusQuantity",
+        "showDetails",
+        "specialValue",
+        "packOddsIdentifier",
+        "priceDiscountStyle",
+        "promoTimerDisplay",
+        "hideTimerThresholdDays",
+        "showPackOdds",
+    )
+
     def __init__(self, data: dict):
         self.id: str = data.get("id", "")
         self.name: str = data.get("name", "")
@@ -27,6 +53,20 @@ class StoreItem:
         self.showPackOdds: bool = data.get("showPackOdds", False)
 
 class Offer:
+    __slots__ = (
+        "inAppProductId",
+        "currencyType",
+        "price",
+        "availableAtEpoch",
+        "localPrice",
+        "countryCode",
+        "currencyCode",
+        "finalTotalAmount",
+        "totalDiscountAmount",
+        "totalDiscountRate",
+        "promotions",
+    )
+
     def __init__(self, data: dict):
         self.inAppProductId: str = data.get("inAppProductId", "")
         self.currencyType: str = data.get("currencyType", "")
@@ -41,11 +81,15 @@ class Offer:
         self.promotions: List[Promotion] = [Promotion(promotion_data) for promotion_data in data.get("promotions", [])]
 
 class BucketItem:
+    __slots__ = ("id", "quantity")
+
     def __init__(self, data: dict):
         self.id: str = data.get("id", "")
         self.quantity: Optional[str] = data.get("quantity")
 
 class Promotion:
+    __slots__ = ("discountAmount", "discountRate", "usage", "startDate", "endDate")
+
     def __init__(self, data: dict):
         self.discountAmount: float = data.get("discountAmount", 0.0)
         self.discountRate: float = data.get("discountRate", 0.0)
@@ -54,5 +98,7 @@ class Promotion:
         self.endDate: str = data.get("endDate", "")
 
 class StoreData:
+    __slots__ = ("items",)
+
     def __init__(self, data: dict):
         self.items: List[StoreItem] = [StoreItem(item) for item in data.get('items', [])]